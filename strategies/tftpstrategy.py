@@ -33,6 +33,7 @@ class UBootTFTPStrategy(Strategy):
 
     def __attrs_post_init__(self):
         super().__attrs_post_init__()
+        self.__staged_file = None
 
     def transition(self, status):
         if not isinstance(status, Status):
@@ -50,25 +51,31 @@ class UBootTFTPStrategy(Strategy):
             self.target.activate(self.tftp)
             self.target.activate(self.console)
 
-            staged_file = self.tftp.stage(self.target.env.config.get_image_path("root"))
-            tftp_server_ip = self.target.get_resource(
-                RemoteTFTPProvider, wait_avail=False
-            ).external_ip
+            # the image does not change during a session, only stage it and
+            # extend the U-Boot environment once; mark it done last so a
+            # failure part way through is retried on the next transition
+            if self.__staged_file is None:
+                staged_file = self.tftp.stage(
+                    self.target.env.config.get_image_path("root")
+                )
+                tftp_server_ip = self.target.get_resource(
+                    RemoteTFTPProvider, wait_avail=False
+                ).external_ip
+
+                init_commands = (f"setenv bootfile {staged_file}",)
+                if tftp_server_ip:
+                    tftp_dut_ip = ipaddress.ip_address(tftp_server_ip) + 1
+                    init_commands = (
+                        f"setenv serverip {tftp_server_ip}",
+                        f"setenv ipaddr {tftp_dut_ip}",
+                    ) + init_commands
+
+                self.uboot.init_commands = init_commands + self.uboot.init_commands
+                self.__staged_file = staged_file
 
             self.power.cycle()
             # interrupt uboot
 
-            self.uboot.init_commands = (
-                f"setenv bootfile {staged_file}",
-            ) + self.uboot.init_commands
-
-            if tftp_server_ip:
-                tftp_dut_ip = ipaddress.ip_address(tftp_server_ip) + 1
-                self.uboot.init_commands = (
-                    f"setenv serverip {tftp_server_ip}",
-                    f"setenv ipaddr {tftp_dut_ip}",
-                ) + self.uboot.init_commands
-
             self.target.activate(self.uboot)
         elif status == Status.shell:
             # transition to uboot
@@ -14,7 +14,9 @@
 
 import json
 import logging
+import shlex
 from os import getenv
+from time import monotonic, sleep
 
 import pytest
 
@@ -33,8 +35,12 @@ def pytest_configure(config):
     config._metadata["environment"] = "staging"
 
 
-def ubus_call(command, namespace, method, params={}):
-    output = command.run_check(f"ubus call {namespace} {method} '{json.dumps(params)}'")
+def ubus_call(command, namespace, method, params=None):
+    cmd = f"ubus call {namespace} {method}"
+    if params:
+        cmd += f" '{json.dumps(params, separators=(',', ':'))}'"
+
+    output = command.run_check(cmd)
 
     try:
         return json.loads("\n".join(output))
@@ -42,6 +48,40 @@ def ubus_call(command, namespace, method, params={}):
         return {}
 
 
+def wait_for(condition, timeout, interval=0.5, max_interval=5):
+    """Poll condition() until it is truthy or timeout seconds have passed.
+
+    The delay between polls doubles from interval up to max_interval. Returns
+    True if the condition was met in time, False otherwise.
+    """
+    deadline = monotonic() + timeout
+    while True:
+        if condition():
+            return True
+
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            return False
+
+        sleep(min(interval, remaining))
+        interval = min(interval * 2, max_interval)
+
+
+def wait_on_device(command, condition, timeout):
+    """Run the shell condition on the device once a second until it succeeds.
+
+    The loop runs on the device as a single command, so the console sees one
+    round trip rather than one per poll. Returns True if the condition
+    succeeded within timeout seconds, False otherwise.
+    """
+    loop = (
+        f"i=0; until {condition}; do "
+        f"[ $i -ge {timeout} ] && exit 1; i=$((i + 1)); sleep 1; done"
+    )
+    _, _, exitcode = command.run(f"sh -c {shlex.quote(loop)}", timeout=timeout + 10)
+    return exitcode == 0
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_env(env, pytestconfig):
     env.config.data.setdefault("images", {})["firmware"] = pytestconfig.getoption(
@@ -49,7 +89,7 @@ def setup_env(env, pytestconfig):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def shell_command(strategy):
     try:
         strategy.transition("shell")
@@ -59,7 +99,7 @@ def shell_command(strategy):
         pytest.exit("Failed to transition to state shell", returncode=3)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ssh_command(shell_command, target):
     ssh = target.get_driver("SSHDriver")
     return ssh
@@ -1,10 +1,30 @@
 import os
 import re
 import tarfile
-import time
 
 import pytest
-from conftest import ubus_call
+from conftest import ubus_call, wait_on_device
+
+KERNEL_ERROR_PATTERNS = [
+    r" Oops:",  # don't trigger on "ramoops"
+    r"(PC is at |pc : )([^+\[ ]+).*",
+    r"BUG:",
+    r"corruption",
+    r"do_page_fault\(\): sending",
+    r"EIP: \[<.*>\] ([^+ ]+).*",
+    r"epc\s+:\s+\S+\s+([^+ ]+).*",
+    r"error.*in",
+    r"hung task",
+    r"Kernel panic",
+    r"Out of memory",
+    r"segfault",
+    r"stack overflow",
+    r"traps:.*general protection",
+    r"Unable to handle kernel",
+]
+
+# one pass over dmesg instead of one findall() per pattern
+KERNEL_ERROR_RE = re.compile(".*(?:" + "|".join(KERNEL_ERROR_PATTERNS) + ").*")
 
 
 def test_shell(shell_command):
@@ -24,13 +44,12 @@ def test_firmware_version(shell_command, record_property):
 
 
 def test_dropbear_startup(shell_command):
-    for i in range(120):
-        if shell_command.run("ls /etc/dropbear/dropbear_rsa_host_key")[2] == 0:
-            if shell_command.run("netstat -tlpn | grep 0.0.0.0:22")[2] == 0:
-                return
-        time.sleep(1)
-
-    assert False, "Dropbear did not start up within 120 seconds"
+    assert wait_on_device(
+        shell_command,
+        "ls /etc/dropbear/dropbear_rsa_host_key >/dev/null 2>&1 "
+        "&& netstat -tlpn | grep -q 0.0.0.0:22",
+        timeout=120,
+    ), "Dropbear did not start up within 120 seconds"
 
 
 def test_ssh(ssh_command):
@@ -48,7 +67,7 @@ def test_uname(ssh_command):
 
 
 def test_ubus_system_board(ssh_command, results_bag):
-    output = ubus_call(ssh_command, "system", "board", {})
+    output = ubus_call(ssh_command, "system", "board")
     assert output["release"]["distribution"] == "OpenWrt"
 
     results_bag["board_name"] = output["board_name"]
@@ -67,25 +86,25 @@ def test_free_memory(ssh_command, results_bag):
 
 
 @pytest.mark.lg_feature("rootfs")
-def test_sysupgrade_backup(ssh_command):
+def test_sysupgrade_backup(ssh_command, tmp_path):
     try:
         ssh_command.run_check("sysupgrade -b /tmp/backup.tar.gz")
-        ssh_command.get("/tmp/backup.tar.gz")
+        ssh_command.get("/tmp/backup.tar.gz", str(tmp_path))
 
-        backup = tarfile.open("backup.tar.gz", "r")
-        assert "etc/config/dropbear" in backup.getnames()
+        with tarfile.open(tmp_path / "backup.tar.gz", "r") as backup:
+            assert "etc/config/dropbear" in backup.getnames()
     finally:
         ssh_command.run("rm -rf /tmp/backup.tar.gz")
 
 
 @pytest.mark.lg_feature("rootfs")
-def test_sysupgrade_backup_u(ssh_command):
+def test_sysupgrade_backup_u(ssh_command, tmp_path):
     try:
         ssh_command.run_check("sysupgrade -u -b /tmp/backup.tar.gz")
-        ssh_command.get("/tmp/backup.tar.gz")
+        ssh_command.get("/tmp/backup.tar.gz", str(tmp_path))
 
-        backup = tarfile.open("backup.tar.gz", "r")
-        assert "etc/config/dropbear" not in backup.getnames()
+        with tarfile.open(tmp_path / "backup.tar.gz", "r") as backup:
+            assert "etc/config/dropbear" not in backup.getnames()
     finally:
         ssh_command.run("rm -rf /tmp/backup.tar.gz")
 
@@ -93,29 +112,7 @@ def test_sysupgrade_backup_u(ssh_command):
 def test_kernel_errors(ssh_command):
     dmesg_output = "\n".join(ssh_command.run_check("dmesg"))
 
-    error_patterns = [
-        r" Oops:",  # don't trigger on "ramoops"
-        r"(PC is at |pc : )([^+\[ ]+).*",
-        r"BUG:",
-        r"corruption",
-        r"do_page_fault\(\): sending",
-        r"EIP: \[<.*>\] ([^+ ]+).*",
-        r"epc\s+:\s+\S+\s+([^+ ]+).*",
-        r"error.*in",
-        r"hung task",
-        r"Kernel panic",
-        r"Out of memory",
-        r"segfault",
-        r"stack overflow",
-        r"traps:.*general protection",
-        r"Unable to handle kernel",
-    ]
-
-    errors_found = []
-    for pattern in error_patterns:
-        matches = re.findall(f".*{pattern}.*", dmesg_output)
-        if matches:
-            errors_found.extend(matches)
+    errors_found = [match.group(0) for match in KERNEL_ERROR_RE.finditer(dmesg_output)]
 
     assert not errors_found, (
         f"Critical errors found in kernel log: {errors_found[:5]}"
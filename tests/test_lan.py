@@ -1,25 +1,21 @@
 from ipaddress import IPv4Interface
-from time import sleep
 
-from conftest import ubus_call
+from conftest import ubus_call, wait_for, wait_on_device
 
-def test_lan_wait_for_link_ready(shell_command):
-    for _ in range(60):
-        if shell_command.run("dmesg | grep br-lan | grep forwarding")[2] == 0:
-            return
-        sleep(1)
 
-    assert False, "LAN interface did not come up within 60 seconds"
+def test_lan_wait_for_link_ready(shell_command):
+    assert wait_on_device(
+        shell_command, "dmesg | grep br-lan | grep -q forwarding", timeout=60
+    ), "LAN interface did not come up within 60 seconds"
 
 
 def test_lan_wait_for_network(shell_command):
-    for _ in range(60):
-        if ubus_call(shell_command, "network.interface.lan", "status").get(
+    assert wait_for(
+        lambda: ubus_call(shell_command, "network.interface.lan", "status").get(
             "ipv4-address"
-        ):
-            return
-
-    assert False, "LAN interface did not come up within 60 seconds"
+        ),
+        timeout=60,
+    ), "LAN interface did not come up within 60 seconds"
 
 
 def test_lan_interface_address(shell_command):
@@ -27,5 +23,6 @@ def test_lan_interface_address(shell_command):
         "192.168.1.1/24"
     )
 
+
 def test_lan_interface_has_neighbor(shell_command):
     assert "DUP!" in "\n".join(shell_command.run("ping -c 3 ff02::1%br-lan")[0])
@@ -2,6 +2,14 @@ import re
 import subprocess
 from collections import defaultdict
 
+NMAP_ALGORITHM_RE = re.compile(
+    r"""
+    ^\|\s{2,}(?P<category>\w+_algorithms):\s\(\d+\)     # Algorithm category
+    |^\|\s{7}(?P<algorithm>[^\n|]+)                     # Algorithm entries
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+
 
 def test_ssh_supported_algorithms(ssh_command):
     with ssh_command.forward_local_port(22) as localport:
@@ -11,18 +19,10 @@ def test_ssh_supported_algorithms(ssh_command):
             shell=True,
         )
 
-        pattern = re.compile(
-            r"""
-        ^\|\s{2,}(?P<category>\w+_algorithms):\s\(\d+\)     # Algorithm category
-        |^\|\s{7}(?P<algorithm>[^\n|]+)                     # Algorithm entries
-        """,
-            re.MULTILINE | re.VERBOSE,
-        )
-
         algorithms = defaultdict(list)
         current_category = None
 
-        for match in pattern.finditer(output):
+        for match in NMAP_ALGORITHM_RE.finditer(output):
             if match.group("category"):
                 current_category = match.group("category")
             elif match.group("algorithm") and current_category:
@@ -9,8 +9,7 @@ def test_opkg_procd_installed(ssh_command):
 @pytest.mark.lg_feature(["online", "opkg"])
 def test_opkg_install_ucert(ssh_command):
     try:
-        ssh_command.run_check("opkg update")
-        ssh_command.run_check("opkg install ucert")
+        ssh_command.run_check("opkg update && opkg install ucert")
         assert "ucert" in "\n".join(ssh_command.run_check("opkg list-installed"))
     finally:
         ssh_command.run("opkg remove ucert")
@@ -57,17 +57,15 @@ class TestSystemHealth:
 
     def test_filesystem_usage(self, ssh_command, results_bag):
         """Test filesystem usage on critical mount points."""
-        # Check key filesystems
-        filesystems = ["/", "/tmp", "/overlay"]
+        # Check key filesystems in one round trip, skipping missing ones
+        df_output = ssh_command.run(
+            "for fs in / /tmp /overlay; do "
+            '[ -d $fs ] && echo "$fs $(df -h $fs | tail -1)"; done'
+        )[0]
         fs_usage = {}
 
-        for fs in filesystems:
-            # Skip if filesystem doesn't exist
-            if ssh_command.run(f"test -d {fs}")[2] != 0:
-                continue
-
-            df_output = ssh_command.run_check(f"df -h {fs} | tail -1")
-            parts = df_output[0].split()
+        for line in df_output:
+            fs, *parts = line.split()
 
             if len(parts) >= 5:
                 fs_usage[fs] = {
@@ -95,18 +93,18 @@ class TestSystemHealth:
 
     def test_temperature_sensors(self, ssh_command, results_bag):
         """Test temperature sensors if available."""
-        # Check if thermal zones exist
+        # Read all thermal zones at once, each line is "<path>:<millidegrees>"
         thermal_zones = ssh_command.run(
-            "ls /sys/class/thermal/thermal_zone*/temp 2>/dev/null"
+            "grep -H . /sys/class/thermal/thermal_zone*/temp 2>/dev/null"
         )[0]
 
         if thermal_zones:
             temperatures = {}
             for zone in thermal_zones:
                 if zone:
-                    temp_raw = ssh_command.run_check(f"cat {zone}")[0]
+                    path, temp_raw = zone.rsplit(":", 1)
                     temp_celsius = int(temp_raw) / 1000
-                    zone_name = zone.split("/")[-2]
+                    zone_name = path.split("/")[-2]
                     temperatures[zone_name] = temp_celsius
 
             results_bag["temperatures"] = temperatures
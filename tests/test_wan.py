@@ -1,5 +1,5 @@
 import pytest
-from conftest import ubus_call
+from conftest import ubus_call, wait_for
 
 
 def check_download(
@@ -44,13 +44,12 @@ def check_download(
 
 @pytest.mark.lg_feature("wan_port")
 def test_wan_wait_for_network(shell_command):
-    for i in range(60):
-        if ubus_call(shell_command, "network.interface.wan", "status").get(
+    assert wait_for(
+        lambda: ubus_call(shell_command, "network.interface.wan", "status").get(
             "ipv4-address"
-        ):
-            return
-
-    assert False, "WAN interface did not come up within 60 seconds"
+        ),
+        timeout=60,
+    ), "WAN interface did not come up within 60 seconds"
 
 
 @pytest.mark.lg_feature("online")
@@ -1,30 +1,44 @@
-import time
-
 import pytest
 
 
-def restart_wifi_and_wait(ssh_command, timeout=5):
+def restart_wifi_and_wait(ssh_command, timeout=10):
     """
     Helper function to restart wifi via ubus and wait for it to settle.
 
     Args:
         ssh_command: SSH command fixture for executing commands
-        timeout: Maximum time to wait for wifi to settle (default: 5 seconds)
+        timeout: Maximum time to wait for wifi to settle (default: 10 seconds)
 
     Returns:
         bool: True if wifi restarted successfully, False if timed out
     """
-    # Restart wifi
-    ssh_command.run("wifi down")
-    time.sleep(2)
-    ssh_command.run("wifi up")
-    time.sleep(2)
+    # Restart wifi, bringing it back up as soon as hostapd is gone
+    ssh_command.run(
+        "wifi down; i=0; "
+        "while ubus list hostapd.phy0-ap0 >/dev/null 2>&1 && [ $i -lt 10 ]; do "
+        "i=$((i + 1)); sleep 1; done; "
+        "wifi up"
+    )
 
-    # Wait till network reload finished
+    # Wait till network reload finished, returns as soon as hostapd is back
     result = ssh_command.run(f"ubus -t {timeout} wait_for hostapd.phy0-ap0")[0]
     return "timed out" not in "\n".join(result)
 
 
+def uci_batch(ssh_command, *commands):
+    """
+    Helper function to run several uci commands in a single SSH round-trip.
+
+    Args:
+        ssh_command: SSH command fixture for executing commands
+        *commands: uci arguments, e.g. "set wireless.radio0.channel=11"
+
+    Returns:
+        tuple: stdout, stderr and exit code of the combined command
+    """
+    return ssh_command.run("; ".join(f"uci {command}" for command in commands))
+
+
 @pytest.mark.lg_feature("wifi")
 def test_wifi_wpa3(ssh_command):
     """
@@ -32,11 +46,13 @@ def test_wifi_wpa3(ssh_command):
 
     This test configures a wifi network with WPA3 encryption and password 'openwrt4all'.
     """
-    ssh_command.run("uci delete wireless.radio0.disabled")
-    ssh_command.run("uci set wireless.default_radio0.encryption=sae")
-    ssh_command.run("uci set wireless.default_radio0.key=openwrt4all")
-
-    ssh_command.run("uci commit")
+    uci_batch(
+        ssh_command,
+        "delete wireless.radio0.disabled",
+        "set wireless.default_radio0.encryption=sae",
+        "set wireless.default_radio0.key=openwrt4all",
+        "commit",
+    )
 
     restart_wifi_and_wait(ssh_command)
 
@@ -56,11 +72,13 @@ def test_wifi_wpa2(ssh_command):
 
     This test configures a wifi network with WPA2 encryption and password 'openwrt4all'.
     """
-    ssh_command.run("uci delete wireless.radio0.disabled")
-    ssh_command.run("uci set wireless.default_radio0.encryption=psk2")
-    ssh_command.run("uci set wireless.default_radio0.key=openwrt4all")
-
-    ssh_command.run("uci commit")
+    uci_batch(
+        ssh_command,
+        "delete wireless.radio0.disabled",
+        "set wireless.default_radio0.encryption=psk2",
+        "set wireless.default_radio0.key=openwrt4all",
+        "commit",
+    )
 
     restart_wifi_and_wait(ssh_command)
 
@@ -81,8 +99,7 @@ def test_wifi_scan(ssh_command):
 
     This test performs a wifi scan and verifies that at least one network is found.
     """
-    ssh_command.run("uci delete wireless.radio0.disabled")
-    ssh_command.run("uci commit")
+    uci_batch(ssh_command, "delete wireless.radio0.disabled", "commit")
 
     restart_wifi_and_wait(ssh_command)
 
@@ -103,26 +120,25 @@ def test_wifi_hwsim_sae_mixed(ssh_command):
     It sets up the wireless configuration using the `ssh_command` fixture and relies on the
     "hwsim" driver to create the virtual radios.
     """
-    ssh_command.run("uci set wireless.radio0.channel=11")
-    ssh_command.run("uci set wireless.radio0.band=2g")
-    ssh_command.run("uci delete wireless.radio0.disabled")
-
-    ssh_command.run("uci set wireless.default_radio0.encryption=sae-mixed")
-    ssh_command.run("uci set wireless.default_radio0.key=testtest")
-
-    ssh_command.run("uci delete wireless.radio1.channel")
-    ssh_command.run("uci set wireless.radio1.band=2g")
-    ssh_command.run("uci delete wireless.radio1.disabled")
-
-    ssh_command.run("uci set wireless.default_radio1.network=wan")
-    ssh_command.run("uci set wireless.default_radio1.mode=sta")
-    ssh_command.run("uci set wireless.default_radio1.encryption=sae-mixed")
-    ssh_command.run("uci set wireless.default_radio1.key=testtest")
+    uci_batch(
+        ssh_command,
+        "set wireless.radio0.channel=11",
+        "set wireless.radio0.band=2g",
+        "delete wireless.radio0.disabled",
+        "set wireless.default_radio0.encryption=sae-mixed",
+        "set wireless.default_radio0.key=testtest",
+        "delete wireless.radio1.channel",
+        "set wireless.radio1.band=2g",
+        "delete wireless.radio1.disabled",
+        "set wireless.default_radio1.network=wan",
+        "set wireless.default_radio1.mode=sta",
+        "set wireless.default_radio1.encryption=sae-mixed",
+        "set wireless.default_radio1.key=testtest",
+    )
 
     assert "-wireless.radio1.disabled" in "\n".join(ssh_command.run("uci changes")[0])
 
-    ssh_command.run("uci commit")
-    ssh_command.run("service network reload")
+    ssh_command.run("uci commit && service network reload")
 
     # wait till network reload finished
     assert "timed out" not in "\n".join(
@@ -155,8 +171,7 @@ def test_wifi_hwsim_sae_mixed(ssh_command):
     assert "wireless.default_radio1.encryption='psk2'" in "\n".join(
         ssh_command.run("uci changes")[0]
     )
-    ssh_command.run("uci commit")
-    ssh_command.run("service network reload")
+    ssh_command.run("uci commit && service network reload")
 
     # Wait till the wifi client is removed
     assert "disassoc" in "\n".join(